@@ -143,8 +143,21 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Number of trusted proxies in front of the app. With 0, client IPs for
+    # throttling come from REMOTE_ADDR and X-Forwarded-For is ignored.
+    'NUM_PROXIES': 0,
+    'DEFAULT_THROTTLE_RATES': {
+        'otp_send_email': '5/hour',
+        'otp_send_ip': '20/hour',
+        'otp_verify_email': '10/hour',
+        'otp_verify_ip': '50/hour',
+    },
 }
 
+# Cache alias holding the OTP throttle counters. Point it at a shared cache
+# (e.g. Redis or Memcached) when running more than one worker process.
+OTP_THROTTLE_CACHE = 'default'
+
 # Initialize environment variables
 env = environ.Env()
 environ.Env.read_env(os.path.join(BASE_DIR, '.env'))